@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import bisect
 import json
 import math
 import threading
 import time
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
 
 try:
     import zmq  # type: ignore
@@ -13,8 +17,27 @@ try:
 except Exception:
     HAS_ZMQ = False
 
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
+try:
+    from numba import njit  # type: ignore
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+    # numba is optional: without it the kernels below run as plain Python
+    def njit(*args, **kwargs):  # type: ignore
+        """No-op stand-in for numba.njit."""
+        def decorate(fn):
+            return fn
+        return decorate
+
 from vpython import canvas, sphere, arrow, vector, color  # type: ignore
 from vpython import button  # type: ignore
+from vpython import rate as _rate  # type: ignore
 
 
 # =========================
@@ -25,6 +48,15 @@ ZMQ_ENDPOINT = "tcp://127.0.0.1:3000"
 
 # Core timing (simulation tick, aligned to game packet cadence)
 PACKET_DT_SECONDS = 0.05  # 50 ms
+_RATE_HZ = int(1.0 / PACKET_DT_SECONDS)
+
+# Zoom is a user action, so clamping it every few ticks is enough
+ZOOM_CLAMP_EVERY_TICKS = 5
+
+# Scene updates are skipped below these L1 changes. Positions are in scene
+# units when scripted and TERA units with USE_LIVE_FEED; angles in radians.
+POS_EPSILON = 1e-4
+AIM_EPSILON = 1e-5
 
 # Control constraint: map max mouse px/sec
 # to a yaw rate (rad/sec)
@@ -40,6 +72,8 @@ TERA_UNITS_PER_METER = 16.49
 # =========================
 @dataclass
 class Position3D:
+    __slots__ = ("x", "y", "z")
+
     x: float
     y: float
     z: float
@@ -47,9 +81,17 @@ class Position3D:
     def to_v(self) -> vector:
         return vector(self.x, self.y, self.z)
 
+    def copy_to(self, v: vector) -> None:
+        # Update an existing VPython vector in place (no allocation)
+        v.x = self.x
+        v.y = self.y
+        v.z = self.z
+
 
 @dataclass
 class Entity:
+    __slots__ = ("name", "type", "position")
+
     name: str
     type: str
     position: Position3D
@@ -57,57 +99,118 @@ class Entity:
 
 @dataclass
 class PlayerState:
+    __slots__ = ("position", "yaw_radians", "pitch_radians")
+
     position: Position3D
     yaw_radians: float
     pitch_radians: float
 
 
 def clamp(value: float, min_value: float, max_value: float) -> float:
-    if value < min_value:
-        return min_value
-    if value > max_value:
-        return max_value
-    return value
+    return min(max(value, min_value), max_value)
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _wrap_angle(d: float) -> float:
+        # Wrap to (-pi, pi]. numba does not support math.remainder, so the
+        # jitted kernels use the floor form
+        two_pi = 2.0 * math.pi
+        d -= two_pi * math.floor((d + math.pi) / two_pi)
+        return math.pi if d == -math.pi else d
+else:
+    def _wrap_angle(d: float) -> float:
+        # Wrap to (-pi, pi]; IEEE remainder gives [-pi, pi] in one libm
+        # call, so only the -pi endpoint needs fixing
+        d = math.remainder(d, math.tau)
+        return d if d != -math.pi else math.pi
 
 
 def angle_diff(current: float, target: float) -> float:
-    # Smallest signed difference in (-pi, pi]
-    d = (target - current + math.pi) % (2 * math.pi) - math.pi
+    # Smallest signed difference in (-pi, pi]; IEEE remainder gives
+    # [-pi, pi] in one libm call, so only the -pi endpoint needs fixing
+    d = math.remainder(target - current, math.tau)
     return d if d != -math.pi else math.pi
 
 
-def forward_from_angles(yaw: float, pitch: float) -> vector:
+def forward_from_angles(
+    yaw: float,
+    pitch: float,
+    _cos=math.cos,
+    _sin=math.sin,
+) -> vector:
     # Standard spherical mapping: yaw around Y, pitch about XZ plane
-    cp = math.cos(pitch)
-    return vector(math.cos(yaw) * cp, math.sin(pitch), math.sin(yaw) * cp)
+    cp = _cos(pitch)
+    return vector(_cos(yaw) * cp, _sin(pitch), _sin(yaw) * cp)
 
 
-def clamp_canvas_zoom(
+def zoom_clamper(
     c: canvas,
     min_range: float = 0.5,
     max_range: float = 200.0,
-) -> None:
-    """Clamp canvas.range to avoid near-plane clipping when zooming.
+) -> Callable[[], None]:
+    """Return a function that clamps c.range to avoid near-plane clipping.
 
-    If range is a vector, clamp by its minimum component and set scalar range.
+    A vector range is collapsed to its minimum component once, here, so the
+    returned function only deals with the scalar case. It assigns range
+    (which triggers a scene update) only when the value is out of bounds.
     """
     r = c.range
-    try:
-        # r may be a vector or a scalar
-        if hasattr(r, "x"):
-            scalar = min(float(r.x), float(r.y), float(r.z))
-        else:
-            scalar = float(r)
-    except Exception:
-        scalar = 1.0
-    scalar = clamp(scalar, min_range, max_range)
-    c.range = scalar
+    if hasattr(r, "x"):
+        c.range = clamp(min(r.x, r.y, r.z), min_range, max_range)
+
+    def run() -> None:
+        scalar = c.range
+        clamped = clamp(scalar, min_range, max_range)
+        if clamped != scalar:
+            c.range = clamped
+
+    return run
 
 
 #############################
 # Controllers & Scenarios   #
 #############################
 
+@njit(cache=True)
+def _smoothpd_step(
+    current: float,
+    desired: float,
+    dt: float,
+    rate: float,
+    wn: float,
+    zeta: float,
+    max_rate: float,
+) -> Tuple[float, float]:
+    """SmoothPDController step; returns (angle, rate).
+
+    The main loop and `control_tick` call this; `SmoothPDController.update`
+    is the plain-Python twin.
+    """
+    err = _wrap_angle(desired - current)
+    rate += (wn * wn * err - 2.0 * zeta * wn * rate) * dt
+    rate = min(max(rate, -max_rate), max_rate)
+    return current + rate * dt, rate
+
+
+@njit(cache=True)
+def _ratelimited_step(
+    current: float,
+    desired: float,
+    dt: float,
+    rate: float,
+    kp: float,
+    max_rate: float,
+) -> Tuple[float, float]:
+    """RateLimitedPController step for the main loop; mirrors `update`.
+
+    Stateless; `rate` is passed through so both steps share a signature.
+    """
+    max_step = max_rate * dt
+    step = min(max(kp * _wrap_angle(desired - current), -max_step), max_step)
+    return current + step, rate
+
+
 class Controller:
     """Compute next yaw given current and desired yaw.
 
@@ -131,10 +234,15 @@ class RateLimitedPController(Controller):
         )
 
     def update(self, current: float, desired: float, dt: float) -> float:
-        err = angle_diff(current, desired)
-        cmd = self.kp * err
+        # Plain Python on purpose: mirrors `_ratelimited_step` without the
+        # per-call jit dispatch. Keep the two in sync.
+        step = self.kp * angle_diff(current, desired)
+        # clamp(), inlined
         max_step = self.max_rate * dt
-        step = clamp(cmd, -max_step, max_step)
+        if step > max_step:
+            step = max_step
+        elif step < -max_step:
+            step = -max_step
         return current + step
 
 
@@ -160,14 +268,110 @@ class SmoothPDController(Controller):
         )
 
     def update(self, current: float, desired: float, dt: float) -> float:
+        # Plain Python on purpose: mirrors `_smoothpd_step` without the
+        # per-call jit dispatch. Keep the two in sync.
         err = angle_diff(current, desired)
         yaw_rate_dot = (
             (self.wn * self.wn) * err
             - 2.0 * self.zeta * self.wn * self.yaw_rate
         )
-        self.yaw_rate += yaw_rate_dot * dt
-        self.yaw_rate = clamp(self.yaw_rate, -self.max_rate, self.max_rate)
-        return current + self.yaw_rate * dt
+        # clamp(), inlined
+        yr = self.yaw_rate + yaw_rate_dot * dt
+        max_rate = self.max_rate
+        if yr > max_rate:
+            yr = max_rate
+        elif yr < -max_rate:
+            yr = -max_rate
+        self.yaw_rate = yr
+        return current + yr * dt
+
+
+def bind_controller(
+    controller: Controller,
+) -> Tuple[Callable[..., Tuple[float, float]], float, Tuple[float, ...]]:
+    """Resolve a controller to (step, initial_state, params) for the loop.
+
+    The loop then calls `angle, state = step(angle, desired, dt, state,
+    *params)`. Known controller types map to the free step functions their
+    `update` mirrors; anything else (including subclasses) goes
+    through its own `update`. Hand the final state to `store_controller`
+    to write it back.
+    """
+    if type(controller) is SmoothPDController:
+        return (
+            _smoothpd_step,
+            controller.yaw_rate,
+            (controller.wn, controller.zeta, controller.max_rate),
+        )
+    if type(controller) is RateLimitedPController:
+        return (
+            _ratelimited_step,
+            0.0,
+            (controller.kp, controller.max_rate),
+        )
+
+    update = controller.update
+
+    def step(
+        current: float, desired: float, dt: float, state: float
+    ) -> Tuple[float, float]:
+        return update(current, desired, dt), state
+
+    return step, 0.0, ()
+
+
+def store_controller(controller: Controller, state: float) -> None:
+    """Write loop state from `bind_controller` back to the controller."""
+    if type(controller) is SmoothPDController:
+        controller.yaw_rate = state
+
+
+@njit(cache=True)
+def control_tick(
+    dx: float,
+    dy: float,
+    dz: float,
+    cur_yaw: float,
+    cur_pitch: float,
+    yaw_rate: float,
+    pitch_rate: float,
+    wn_y: float,
+    z_y: float,
+    max_y: float,
+    wn_p: float,
+    z_p: float,
+    max_p: float,
+    max_pitch: float,
+    dt: float,
+) -> Tuple[float, float, float, float, float, float, float]:
+    """One full SmoothPD aim tick for both axes, as a single kernel.
+
+    Equivalent to aiming at (dx, dy, dz), calling `update` on a yaw and a
+    pitch SmoothPDController, clamping pitch to +/- max_pitch and taking
+    `forward_from_angles` of the result. Returns
+    (yaw, pitch, fwd_x, fwd_y, fwd_z, yaw_rate, pitch_rate).
+    """
+    desired_yaw = math.atan2(dz, dx)
+    desired_pitch = math.atan2(dy, math.hypot(dx, dz))
+
+    yaw, yaw_rate = _smoothpd_step(
+        cur_yaw, desired_yaw, dt, yaw_rate, wn_y, z_y, max_y
+    )
+    pitch, pitch_rate = _smoothpd_step(
+        cur_pitch, desired_pitch, dt, pitch_rate, wn_p, z_p, max_p
+    )
+    pitch = min(max(pitch, -max_pitch), max_pitch)
+
+    cp = math.cos(pitch)
+    return (
+        yaw,
+        pitch,
+        math.cos(yaw) * cp,
+        math.sin(pitch),
+        math.sin(yaw) * cp,
+        yaw_rate,
+        pitch_rate,
+    )
 
 
 class Scenario:
@@ -181,20 +385,57 @@ class Scenario:
 
 
 class CircleEnemyScenario(Scenario):
+    """Constant-speed circle in the XZ plane.
+
+    When called once per tick (t advancing by `dt`), the angle is advanced
+    by a precomputed rotation instead of fresh cos/sin calls. Any other t
+    recomputes it directly, as does every `RESYNC_TICKS`-th step to bound
+    rounding drift.
+    """
+
+    RESYNC_TICKS = 1024
+
     def __init__(
         self,
         radius: float = 10.0,
         angular_speed: float = 0.5,
+        dt: float = PACKET_DT_SECONDS,
     ) -> None:
         self.radius = radius
         self.omega = angular_speed
+        self.dt = dt
+        self._step_c = math.cos(angular_speed * dt)
+        self._step_s = math.sin(angular_speed * dt)
+        self.reset()
+
+    def reset(self) -> None:
+        self._t: Optional[float] = None
+        self._c = 1.0
+        self._s = 0.0
+        self._steps = 0
+
+    def _unit(self, t: float) -> Tuple[float, float]:
+        """Return (cos(omega * t), sin(omega * t))."""
+        prev = self._t
+        self._t = t
+        if (
+            prev is not None
+            and abs(t - prev - self.dt) < 1e-9
+            and self._steps < self.RESYNC_TICKS
+        ):
+            c, s = self._c, self._s
+            self._c = self._step_c * c - self._step_s * s
+            self._s = self._step_s * c + self._step_c * s
+            self._steps += 1
+        else:
+            self._c = math.cos(self.omega * t)
+            self._s = math.sin(self.omega * t)
+            self._steps = 0
+        return self._c, self._s
 
     def enemy_position(self, t: float) -> Position3D:
-        return Position3D(
-            self.radius * math.cos(self.omega * t),
-            0.0,
-            self.radius * math.sin(self.omega * t),
-        )
+        c, s = self._unit(t)
+        return Position3D(self.radius * c, 0.0, self.radius * s)
 
 
 class KeyframedEnemyScenario(Scenario):
@@ -213,25 +454,28 @@ class KeyframedEnemyScenario(Scenario):
         self.waypoints = tuple(sorted(waypoints, key=lambda p: p[0]))
         self.loop = loop
         self.total = self.waypoints[-1][0]
+        # Key times for binary search; never change after construction
+        self._ts = tuple(w[0] for w in self.waypoints)
 
     def enemy_position(self, t: float) -> Position3D:
         if self.loop and self.total > 0.0:
             t = t % self.total
-        # find segment
-        for i in range(len(self.waypoints) - 1):
-            t0, p0 = self.waypoints[i]
-            t1, p1 = self.waypoints[i + 1]
-            if t0 <= t <= t1:
-                u = 0.0 if t1 == t0 else (t - t0) / (t1 - t0)
-                x = p0.x + (p1.x - p0.x) * u
-                y = p0.y + (p1.y - p0.y) * u
-                z = p0.z + (p1.z - p0.z) * u
-                return Position3D(x, y, z)
-        # out of range: clamp to last
-        return self.waypoints[-1][1]
-
-
-class HelixEnemyScenario(Scenario):
+        ts = self._ts
+        if not ts[0] <= t <= ts[-1]:
+            # out of range: clamp to last
+            return self.waypoints[-1][1]
+        # find segment: ts[i] <= t <= ts[i + 1]
+        i = min(max(bisect.bisect_left(ts, t) - 1, 0), len(ts) - 2)
+        t0, p0 = self.waypoints[i]
+        t1, p1 = self.waypoints[i + 1]
+        u = 0.0 if t1 == t0 else (t - t0) / (t1 - t0)
+        x = p0.x + (p1.x - p0.x) * u
+        y = p0.y + (p1.y - p0.y) * u
+        z = p0.z + (p1.z - p0.z) * u
+        return Position3D(x, y, z)
+
+
+class HelixEnemyScenario(CircleEnemyScenario):
     """3D helix motion for vertical testing."""
 
     def __init__(
@@ -239,17 +483,14 @@ class HelixEnemyScenario(Scenario):
         radius: float = 8.0,
         angular_speed: float = 0.6,
         vertical_speed: float = 1.0,
+        dt: float = PACKET_DT_SECONDS,
     ) -> None:
-        self.radius = radius
-        self.omega = angular_speed
+        super().__init__(radius, angular_speed, dt)
         self.vy = vertical_speed
 
     def enemy_position(self, t: float) -> Position3D:
-        return Position3D(
-            self.radius * math.cos(self.omega * t),
-            self.vy * t,
-            self.radius * math.sin(self.omega * t),
-        )
+        c, s = self._unit(t)
+        return Position3D(self.radius * c, self.vy * t, self.radius * s)
 
 
 # Example scripts: pair a scenario with a controller and parameters
@@ -295,41 +536,24 @@ SCRIPTS: Dict[str, Dict[str, object]] = {
 }
 
 
-class HelixEnemyScenario(Scenario):
-    """3D helix motion for vertical testing."""
-
-    def __init__(
-        self,
-        radius: float = 8.0,
-        angular_speed: float = 0.6,
-        vertical_speed: float = 1.0,
-    ) -> None:
-        self.radius = radius
-        self.omega = angular_speed
-        self.vy = vertical_speed
-
-    def enemy_position(self, t: float) -> Position3D:
-        return Position3D(
-            self.radius * math.cos(self.omega * t),
-            self.vy * t,
-            self.radius * math.sin(self.omega * t),
-        )
-
-
 class LiveFeed:
     """Background ZeroMQ subscriber updating shared state for visualization.
 
     Expects JSON messages with at least keys:
       - player: { position: {x, y, z}, direction?: float }
       - entities: [ { name, type, position: {x, y, z} }, ... ]
+
+    Parsing happens on the subscriber thread. Snapshots hold the raw
+    `player` dict, `positions`, the (N, 3) array from `entity_positions`,
+    and `entities`, the usable entity dicts row-aligned with it.
     """
 
     def __init__(self, endpoint: str) -> None:
         if not HAS_ZMQ:
             raise RuntimeError("pyzmq not installed but USE_LIVE_FEED=True")
         self.endpoint = endpoint
-        self._lock = threading.Lock()
-        self._latest: Dict[str, object] = {}
+        # Replaced wholesale on publish, never mutated: readers need no lock
+        self._latest: Mapping[str, object] = MappingProxyType({})
         self._running = False
         self._thread: Optional[threading.Thread] = None
 
@@ -349,49 +573,104 @@ class LiveFeed:
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=1.0)
 
-    def snapshot(self) -> Dict[str, object]:
-        with self._lock:
-            return dict(self._latest)
+    def snapshot(self) -> Mapping[str, object]:
+        # Reference assignment is atomic, so this is always a complete,
+        # read-only snapshot; no copy needed
+        return self._latest
 
     def _run(self) -> None:
         context = zmq.Context.instance()
         socket = context.socket(zmq.SUB)
+        # Keep only the newest snapshot; must be set before connect()
+        socket.setsockopt(zmq.CONFLATE, 1)
         socket.connect(self.endpoint)
         socket.setsockopt(zmq.SUBSCRIBE, b"")
-        socket.RCVTIMEO = 250  # ms
+        # Wait on a poller rather than RCVTIMEO so idle intervals don't
+        # raise zmq.error.Again; the timeout bounds stop() latency
+        poller = zmq.Poller()
+        poller.register(socket, zmq.POLLIN)
 
+        last_buf: Optional[memoryview] = None
         while self._running:
             try:
-                msg = socket.recv_string()
-            except zmq.error.Again:
-                continue
+                if not poller.poll(250):  # ms
+                    continue
+                # Zero-copy frame; decoded straight from the buffer below
+                buf = socket.recv(zmq.NOBLOCK, copy=False).buffer
             except Exception:
                 # Backoff briefly on unexpected errors
                 time.sleep(0.05)
                 continue
 
+            # The mod republishes on a timer; skip re-parsing identical frames
+            if buf == last_buf:
+                continue
+            last_buf = buf
+
             try:
-                data = json.loads(msg)
+                if HAS_ORJSON:
+                    data = orjson.loads(buf)
+                else:
+                    data = json.loads(bytes(buf))
             except Exception:
                 continue
+            if not isinstance(data, dict):
+                continue
+
+            ents = data.get("entities")
+            positions, ents = entity_positions(
+                ents if isinstance(ents, list) else []
+            )
+            self._latest = MappingProxyType(
+                {
+                    "player": data.get("player"),
+                    "entities": ents,
+                    "positions": positions,
+                }
+            )
 
-            with self._lock:
-                self._latest = data
+
+def entity_positions(
+    entities_raw: List[Dict[str, object]],
+) -> Tuple[np.ndarray, List[Dict[str, object]]]:
+    """Pack raw entity positions into an (N, 3) float64 array.
+
+    Returns the array and the entity dicts it was built from, row-aligned.
+    Malformed entries (not a dict, or a coordinate that doesn't convert to
+    float) are skipped; a missing coordinate defaults to 0.0.
+    """
+    coords: List[float] = []
+    valid: List[Dict[str, object]] = []
+    for ed in entities_raw:
+        if not isinstance(ed, dict):
+            continue
+        pos = ed.get("position") or {}
+        try:
+            x = float(pos.get("x", 0.0))
+            y = float(pos.get("y", 0.0))
+            z = float(pos.get("z", 0.0))
+        except Exception:
+            continue
+        coords.extend((x, y, z))
+        valid.append(ed)
+    return np.array(coords, dtype=np.float64).reshape(-1, 3), valid
 
 
 def find_nearest_enemy(
-    player_pos: Position3D,
-    entities: Tuple[Entity, ...],
-) -> Optional[Entity]:
-    best: Optional[Tuple[float, Entity]] = None
-    for e in entities:
-        dx = e.position.x - player_pos.x
-        dy = e.position.y - player_pos.y
-        dz = e.position.z - player_pos.z
-        dist_sq = dx * dx + dy * dy + dz * dz
-        if best is None or dist_sq < best[0]:
-            best = (dist_sq, e)
-    return best[1] if best else None
+    player_vec: np.ndarray,
+    positions: np.ndarray,
+    entities_raw: List[Dict[str, object]],
+) -> Optional[Dict[str, object]]:
+    """Return the raw entity dict closest to the player.
+
+    `positions` is the (N, 3) array from `entity_positions`, row-aligned
+    with `entities_raw`. Only the winner needs to become an `Entity`.
+    """
+    if len(positions) == 0:
+        return None
+    d = positions - player_vec
+    i = int(np.einsum("ij,ij->i", d, d).argmin())
+    return entities_raw[i]
 
 
 def setup_canvases() -> Tuple[canvas, canvas]:
@@ -411,6 +690,9 @@ def setup_canvases() -> Tuple[canvas, canvas]:
     world.camera.pos = vector(0.0, 30.0, 0.0)
     world.camera.axis = vector(0.0, -1.0, 0.0)
     world.up = vector(0.0, 0.0, -1.0)
+    # The FPV camera is placed explicitly every tick; autoscale would only
+    # re-fit the range to moving objects and fight it
+    fpv.autoscale = False
 
     return world, fpv
 
@@ -435,6 +717,23 @@ def main() -> None:
         position=scenario.enemy_position(0.0),
     )
 
+    # Resolve each controller to a monomorphic step function once, so the
+    # loop never goes through Controller.update dispatch. Gains and rates
+    # live in plain floats.
+    step_yaw, yaw_rate, params_y = bind_controller(controller_yaw)
+    step_pitch, pitch_rate, params_p = bind_controller(controller_pitch)
+    # Both axes on SmoothPD: run the fused control_tick kernel instead
+    use_pd_kernel = (
+        step_yaw is _smoothpd_step and step_pitch is _smoothpd_step
+    )
+    if use_pd_kernel:
+        wn_y, z_y, max_y = params_y
+        wn_p, z_p, max_p = params_p
+    # Loop invariants, resolved once instead of looked up every tick
+    max_pitch = math.radians(89.0)
+    _atan2 = math.atan2
+    _hypot = math.hypot
+
     # Optional ZeroMQ live feed
     live: Optional[LiveFeed] = None
     if USE_LIVE_FEED:
@@ -469,10 +768,11 @@ def main() -> None:
         color=color.red,
         shininess=0.6,
     )
+    fwd = forward_from_angles(player.yaw_radians, player.pitch_radians)
     p_fwd = arrow(
         canvas=world,
         pos=player_s.pos,
-        axis=forward_from_angles(player.yaw_radians, player.pitch_radians),
+        axis=fwd,
         color=color.yellow,
         shaftwidth=0.06,
     )
@@ -484,40 +784,48 @@ def main() -> None:
         shaftwidth=0.06,
     )
 
-    def update_fpv_camera() -> None:
-        eye_h = 1.6
-        fwd = forward_from_angles(player.yaw_radians, player.pitch_radians)
-        fpv.camera.pos = player_s.pos + vector(0.0, eye_h, 0.0)
+    eye_offset = vector(0.0, 1.6, 0.0)
+    fpv_up = vector(0.0, 1.0, 0.0)
+
+    def update_fpv_camera(fwd: vector) -> None:
+        # camera.pos is derived from center/axis, so it is assigned, not
+        # mutated in place
+        fpv.camera.pos = player_s.pos + eye_offset
         # Look several units ahead to avoid near-plane/zero-length axis issues
         fpv.camera.axis = fwd * 6.0
         fpv.center = fpv.camera.pos + fwd * 6.0
-        fpv.up = vector(0.0, 1.0, 0.0)
+        fpv.up = fpv_up
 
-    update_fpv_camera()
+    update_fpv_camera(fwd)
 
     # UI: camera snap buttons (attached to the `world` canvas)
     def snap_top_down() -> None:
         world.camera.pos = player_s.pos + vector(0.0, 30.0, 0.0)
         world.camera.axis = vector(0.0, -1.0, 0.0)
         world.up = vector(0.0, 0.0, -1.0)
+        # The loop only re-centers when the player moves, so re-pin here
+        world.center = player_s.pos
 
     def snap_xz() -> None:
         # Side view (XZ plane), looking along +Z
         world.camera.pos = player_s.pos + vector(0.0, 10.0, -25.0)
         world.camera.axis = vector(0.0, -0.4, 1.0)
         world.up = vector(0.0, 1.0, 0.0)
+        world.center = player_s.pos
 
     def snap_xy() -> None:
         # Front view (XY plane), looking along +Y
         world.camera.pos = player_s.pos + vector(0.0, -25.0, 0.0)
         world.camera.axis = vector(0.0, 1.0, 0.0)
         world.up = vector(0.0, 0.0, 1.0)
+        world.center = player_s.pos
 
     def snap_yz() -> None:
         # Right view (YZ plane), looking along +X
         world.camera.pos = player_s.pos + vector(-25.0, 0.0, 0.0)
         world.camera.axis = vector(1.0, 0.0, 0.0)
         world.up = vector(0.0, 1.0, 0.0)
+        world.center = player_s.pos
 
     # VPython buttons render on the most recently activated canvas
     world.append_to_caption("\nCamera snaps: ")
@@ -530,18 +838,29 @@ def main() -> None:
     button(bind=lambda: snap_yz(), text="YZ")
     world.append_to_caption("\n\n")
 
+    # Last values pushed to the scene; updates below this are skipped
+    prev_player = (player.position.x, player.position.y, player.position.z)
+    prev_enemy = (enemy.position.x, enemy.position.y, enemy.position.z)
+    prev_aim = (player.yaw_radians, player.pitch_radians)
+    world.center = player_s.pos
+    clamp_world_zoom = zoom_clamper(world, min_range=0.6, max_range=300.0)
+    clamp_fpv_zoom = zoom_clamper(fpv, min_range=0.6, max_range=50.0)
+
     t = 0.0
+    tick = 0
     try:
         while True:
-            # Rate limit to the game packet cadence
-            from vpython import rate  # local import
-            rate(int(1.0 / PACKET_DT_SECONDS))
+            # Rate limit to the game packet cadence. All scene mutations
+            # below happen between rate() calls, so VPython ships them to
+            # the browser as one batch per tick.
+            _rate(_RATE_HZ)
+            tick += 1
 
             # Live feed snapshot → update player/enemy if available
             if live is not None:
                 snap = live.snapshot()
                 # player
-                p = snap.get("player") if isinstance(snap, dict) else None
+                p = snap.get("player")
                 if isinstance(p, dict):
                     pos = p.get("position")
                     if isinstance(pos, dict):
@@ -562,17 +881,23 @@ def main() -> None:
                             player.pitch_radians = float(p.get("pitch") or 0.0)
                         except Exception:
                             pass
-                # enemies → pick nearest
-                ents_list = []
-                entities_raw = (
-                    snap.get("entities") if isinstance(snap, dict) else None
-                )
-                for ed in (entities_raw or []):
-                    if not isinstance(ed, dict):
-                        continue
-                    pos = ed.get("position") or {}
-                    try:
-                        e = Entity(
+                # enemies → pick nearest, build an Entity only for it
+                entities_raw = snap.get("entities")
+                positions = snap.get("positions")
+                if positions is not None:
+                    player_vec = np.array(
+                        (
+                            player.position.x,
+                            player.position.y,
+                            player.position.z,
+                        )
+                    )
+                    ed = find_nearest_enemy(
+                        player_vec, positions, entities_raw
+                    )
+                    if ed is not None:
+                        pos = ed.get("position") or {}
+                        enemy = Entity(
                             name=str(ed.get("name", "enemy")),
                             type=str(ed.get("type", "mob")),
                             position=Position3D(
@@ -581,16 +906,6 @@ def main() -> None:
                                 float(pos.get("z", 0.0)),
                             ),
                         )
-                        ents_list.append(e)
-                    except Exception:
-                        continue
-                if ents_list:
-                    target = find_nearest_enemy(
-                        player.position,
-                        tuple(ents_list),
-                    )
-                    if target is not None:
-                        enemy = target
 
             else:
                 # Scripted scenario
@@ -601,23 +916,56 @@ def main() -> None:
             dx = enemy.position.x - player.position.x
             dy = enemy.position.y - player.position.y
             dz = enemy.position.z - player.position.z
-            desired_yaw = math.atan2(dz, dx)
-            dist_xz = math.hypot(dx, dz)
-            desired_pitch = math.atan2(dy, dist_xz)
 
             # Apply controllers (yaw and pitch)
-            player.yaw_radians = controller_yaw.update(
-                player.yaw_radians, desired_yaw, PACKET_DT_SECONDS
-            )
-            player.pitch_radians = controller_pitch.update(
-                player.pitch_radians, desired_pitch, PACKET_DT_SECONDS
-            )
-            # Clamp pitch to avoid flipping (±89°)
-            player.pitch_radians = clamp(
-                player.pitch_radians,
-                -math.radians(89.0),
-                math.radians(89.0),
-            )
+            if use_pd_kernel:
+                (
+                    player.yaw_radians,
+                    player.pitch_radians,
+                    fwd_x,
+                    fwd_y,
+                    fwd_z,
+                    yaw_rate,
+                    pitch_rate,
+                ) = control_tick(
+                    dx,
+                    dy,
+                    dz,
+                    player.yaw_radians,
+                    player.pitch_radians,
+                    yaw_rate,
+                    pitch_rate,
+                    wn_y,
+                    z_y,
+                    max_y,
+                    wn_p,
+                    z_p,
+                    max_p,
+                    max_pitch,
+                    PACKET_DT_SECONDS,
+                )
+            else:
+                desired_yaw = _atan2(dz, dx)
+                dist_xz = _hypot(dx, dz)
+                desired_pitch = _atan2(dy, dist_xz)
+                player.yaw_radians, yaw_rate = step_yaw(
+                    player.yaw_radians,
+                    desired_yaw,
+                    PACKET_DT_SECONDS,
+                    yaw_rate,
+                    *params_y,
+                )
+                player.pitch_radians, pitch_rate = step_pitch(
+                    player.pitch_radians,
+                    desired_pitch,
+                    PACKET_DT_SECONDS,
+                    pitch_rate,
+                    *params_p,
+                )
+                # Clamp pitch to avoid flipping (±89°)
+                player.pitch_radians = clamp(
+                    player.pitch_radians, -max_pitch, max_pitch
+                )
 
             # Optional: simulate player movement here if desired
             # player.position.x += (
@@ -627,30 +975,65 @@ def main() -> None:
             #     math.sin(player.yaw_radians) * 0.0 * PACKET_DT_SECONDS
             # )
 
-            # Update visuals
-            player_s.pos = player.position.to_v()
-            new_enemy_pos_v = enemy.position.to_v()
-            enemy_s.pos = new_enemy_pos_v
-            p_fwd.pos = player_s.pos
-            p_fwd.axis = forward_from_angles(
-                player.yaw_radians, player.pitch_radians
+            # Update visuals (in place; to_v() is only used for setup).
+            # Each group is skipped when it has not meaningfully moved.
+            pp = player.position
+            player_moved = (
+                abs(pp.x - prev_player[0])
+                + abs(pp.y - prev_player[1])
+                + abs(pp.z - prev_player[2])
+                > POS_EPSILON
             )
-            e_fwd.pos = enemy_s.pos
-            e_fwd.axis = forward_from_angles(0.0, 0.0)
-
-            update_fpv_camera()
+            if player_moved:
+                prev_player = (pp.x, pp.y, pp.z)
+                pp.copy_to(player_s.pos)
+                pp.copy_to(p_fwd.pos)
+                # Keep world view centered on the player
+                world.center = player_s.pos
+
+            ep = enemy.position
+            if (
+                abs(ep.x - prev_enemy[0])
+                + abs(ep.y - prev_enemy[1])
+                + abs(ep.z - prev_enemy[2])
+                > POS_EPSILON
+            ):
+                prev_enemy = (ep.x, ep.y, ep.z)
+                ep.copy_to(enemy_s.pos)
+                # e_fwd.axis is constant (yaw = pitch = 0), set at creation
+                ep.copy_to(e_fwd.pos)
+                # Sync FPV scene objects
+                ep.copy_to(enemy_s_fpv.pos)
+
+            aim_changed = (
+                abs(player.yaw_radians - prev_aim[0])
+                + abs(player.pitch_radians - prev_aim[1])
+                > AIM_EPSILON
+            )
+            if aim_changed:
+                prev_aim = (player.yaw_radians, player.pitch_radians)
+                # One forward vector, shared by the arrow and FPV camera
+                if use_pd_kernel:
+                    fwd = vector(fwd_x, fwd_y, fwd_z)
+                else:
+                    fwd = forward_from_angles(
+                        player.yaw_radians, player.pitch_radians
+                    )
+                p_fwd.axis = fwd
 
-            # Sync FPV scene objects
-            enemy_s_fpv.pos = new_enemy_pos_v
+            if player_moved or aim_changed:
+                update_fpv_camera(fwd)
 
-            # Keep world view centered and clamp zoom to avoid disappearance
-            world.center = player_s.pos
-            clamp_canvas_zoom(world, min_range=0.6, max_range=300.0)
-            clamp_canvas_zoom(fpv, min_range=0.6, max_range=50.0)
+            # Clamp zoom to avoid disappearance
+            if tick % ZOOM_CLAMP_EVERY_TICKS == 0:
+                clamp_world_zoom()
+                clamp_fpv_zoom()
 
     except KeyboardInterrupt:
         pass
     finally:
+        store_controller(controller_yaw, yaw_rate)
+        store_controller(controller_pitch, pitch_rate)
         if live is not None:
             live.stop()
 
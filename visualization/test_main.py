@@ -0,0 +1,38 @@
+import math
+
+from main import _wrap_angle, angle_diff
+
+
+def _old_angle_diff(current: float, target: float) -> float:
+    # The pre-remainder formula, kept as the reference for the sign convention
+    d = (target - current + math.pi) % (2 * math.pi) - math.pi
+    return d if d != -math.pi else math.pi
+
+
+def test_angle_diff_edges() -> None:
+    assert angle_diff(0.0, math.pi) == math.pi
+    assert angle_diff(0.0, -math.pi) == math.pi
+    assert angle_diff(math.pi, -math.pi) == 0.0
+    assert angle_diff(0.0, 2 * math.pi) == 0.0
+    assert angle_diff(0.0, -2 * math.pi) == 0.0
+    assert angle_diff(0.0, 3 * math.pi) == math.pi
+
+
+def test_wrap_angle_edges() -> None:
+    assert _wrap_angle(math.pi) == math.pi
+    assert _wrap_angle(-math.pi) == math.pi
+    assert _wrap_angle(2 * math.pi) == 0.0
+    assert _wrap_angle(-2 * math.pi) == 0.0
+
+
+def test_angle_diff_matches_old_formula() -> None:
+    for i in range(-400, 401):
+        current = i * 0.173
+        for target in (-7.0, -math.pi, -1.0, 0.0, 0.5, math.pi, 9.0):
+            d = angle_diff(current, target)
+            assert -math.pi < d <= math.pi
+            assert math.isclose(
+                d, _old_angle_diff(current, target), abs_tol=1e-12
+            ) or math.isclose(abs(d), math.pi, abs_tol=1e-12)
+            wrapped = _wrap_angle(target - current)
+            assert math.isclose(wrapped, d, abs_tol=1e-12)
@@ -1,18 +1,32 @@
+import io
+import sys
 import zmq
-import json
-import time
-import math
 import os
 
+import numpy as np
+
+try:
+    import orjson as _json  # parses bytes directly, no str decode
+except ImportError:
+    import json as _json
+
 TERA_UNITS_PER_METER = 16.49  # same factor the mod uses
+MAX_ROWS = 35
+
+# Cursor home + clear screen; the whole frame goes out in one write
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+if os.name == 'nt':
+    os.system('')  # enable ANSI escape handling in the Windows console
 
 socket = zmq.Context().socket(zmq.SUB)
+socket.setsockopt(zmq.CONFLATE, 1)  # only the latest snapshot matters
 socket.connect("tcp://127.0.0.1:3000")
 socket.setsockopt(zmq.SUBSCRIBE, b"")
 
-
-def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+# Block in the kernel until a message arrives (100 ms timeout keeps
+# Ctrl+C responsive) instead of spinning on NOBLOCK + sleep
+poller = zmq.Poller()
+poller.register(socket, zmq.POLLIN)
 
 
 def format_position(pos):
@@ -20,52 +34,59 @@ def format_position(pos):
 
 
 while True:
-    try:
-        message = socket.recv_string(zmq.NOBLOCK)
-    except zmq.error.Again:
-        time.sleep(0.01)
+    if not poller.poll(100):
         continue
 
+    message = socket.recv()
     if not message:
         continue
 
-    data = json.loads(message)
+    data = _json.loads(message)
     player_pos = data['player']['position']
-
-    # Clear screen and show header
-    clear_screen()
-    print("=" * 80)
-    print("TERA BOT - Entity Monitor")
-    print("=" * 80)
-    print(f"Player Position: {format_position(player_pos)}")
-    print("-" * 80)
-    print(f"{'Name':<20} {'Type':<15} {'Distance':<10} {'Position'}")
-    print("-" * 80)
-
-    # Sort entities by distance for better readability
-    entities_with_distance = []
-    for entity in data['entities']:
-        pos = entity['position']
-        dx = pos['x'] - player_pos['x']
-        dy = pos['y'] - player_pos['y']
-        dz = pos['z'] - player_pos['z']
-        distance_units = math.sqrt(dx*dx + dy*dy + dz*dz)
-        distance_m = distance_units / TERA_UNITS_PER_METER
-        entities_with_distance.append((entity, distance_m))
-
-    # Sort by distance (closest first)
-    entities_with_distance.sort(key=lambda x: x[1])
-
-    # Limit to 35 closest entities
-    entities_to_show = entities_with_distance[:35]
+    entities = data['entities']
+
+    # Build the frame in memory, then clear and draw with a single write
+    buf = io.StringIO()
+    buf.write("=" * 80 + "\n")
+    buf.write("TERA BOT - Entity Monitor\n")
+    buf.write("=" * 80 + "\n")
+    buf.write(f"Player Position: {format_position(player_pos)}\n")
+    buf.write("-" * 80 + "\n")
+    buf.write(f"{'Name':<20} {'Type':<15} {'Distance':<10} {'Position'}\n")
+    buf.write("-" * 80 + "\n")
+
+    # Squared distances for all entities in one vectorized pass
+    positions = np.array(
+        [(e['position']['x'], e['position']['y'], e['position']['z'])
+         for e in entities],
+        dtype=np.float64,
+    ).reshape(-1, 3)
+    player = np.array((player_pos['x'], player_pos['y'], player_pos['z']))
+    diff = positions - player
+    dist_sq = np.einsum('ij,ij->i', diff, diff)
+
+    # Closest MAX_ROWS entities, closest first (no need to sort the rest).
+    # Stable sorts keep equal distances in input order, as list.sort did,
+    # so tied rows don't swap between frames.
+    closest = np.arange(len(dist_sq))
+    if len(dist_sq) > MAX_ROWS:
+        cutoff = np.partition(dist_sq, MAX_ROWS - 1)[MAX_ROWS - 1]
+        closest = np.flatnonzero(dist_sq <= cutoff)
+    order = np.argsort(dist_sq[closest], kind="stable")[:MAX_ROWS]
+    closest = closest[order]
+    distances_m = np.sqrt(dist_sq[closest]) / TERA_UNITS_PER_METER
 
     # Display entities
-    for entity, distance_m in entities_to_show:
+    for i, distance_m in zip(closest.tolist(), distances_m.tolist()):
+        entity = entities[i]
         name = entity['name'][:19]  # Truncate long names
         entity_type = entity['type'][:14]  # Truncate long types
         pos = entity['position']
-        print(f"{name:<20} {entity_type:<15} {distance_m:>7.1f}m   {format_position(pos)}")
+        buf.write(f"{name:<20} {entity_type:<15} {distance_m:>7.1f}m   {format_position(pos)}\n")
+
+    buf.write("=" * 80 + "\n")
+    buf.write(f"Total entities: {len(entities)}\n")
+    buf.write("Press Ctrl+C to exit\n")
 
-    print("=" * 80)
-    print(f"Total entities: {len(data['entities'])}")
-    print("Press Ctrl+C to exit")
+    sys.stdout.write(CLEAR_SCREEN + buf.getvalue())
+    sys.stdout.flush()